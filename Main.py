@@ -1,13 +1,112 @@
 import os
-import pandas as pd
-from playwright.sync_api import sync_playwright, Page
+import asyncio
+from playwright.async_api import async_playwright, Page, Browser, ElementHandle, Error, Route
 import time
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+from rapidfuzz import fuzz
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+from rapidfuzz.utils import default_process
 import csv
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+from contextlib import ExitStack
+from typing import List, Dict, Tuple, Union
 import logging
 
+MAX_PARALLEL = 5  # Number of names searched concurrently, each in its own browser context
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}  # Never read by the scraper; stylesheets stay so text visibility is correct
+MATCH_THRESHOLD = 90  # Minimum fuzzy score for a search result or an existing profile to count as the same name
+POSTPROCESS_WORKERS = 2  # Threads scoring duplicates and writing CSV rows while pages keep loading
+PAGE_LOST_MARKERS = ("Target closed", "has been closed", "crashed")  # Playwright error texts for a closed or crashed page
+CSV_BUFFER_SIZE = 1 << 20  # Write buffer for each output CSV file, kept open for the whole run
+
+# Output CSV files and their columns, keyed by data type
+OUTPUT_FILES = {
+    'profiles': ('ExtractedProfiles.csv', ['name', 'headline', 'location', 'duplicate_count']),
+    'education': ('Education.csv', ['name', 'school', 'duration']),
+    'experiences': ('Experiences.csv', ['name', 'title', 'company', 'duration', 'location']),
+    'skills': ('Skills.csv', ['name', 'skill'])
+}
+
+# LinkedIn pages and selectors used while logging in and searching
+LOGIN_URL = "https://www.linkedin.com/login"
+FEED_URL = "https://www.linkedin.com/feed/"
+PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/?keywords={}"
+USERNAME_SEL = "#username"
+PASSWORD_SEL = "#password"
+SUBMIT_SEL = "button[type='submit']"
+VERIFICATION_HEADER_SEL = "h1.content__header"
+SEARCH_INPUT_SEL = "input[placeholder='Search']"
+SEARCH_RESULT_SEL = "div[data-chameleon-result-urn]"
+SEARCH_SETTLED_SEL = f"{SEARCH_RESULT_SEL}, div.search-no-results, .search-reusable-search-no-results"  # Either results or the empty-results page
+RESULT_NAME_SEL = "a span[aria-hidden='true']"
+RESULT_LINK_SEL = "a[href]"
+PROFILE_URL_PATTERN = "**/in/**"
+PROFILE_HEADING_SEL = "main h1"
+
+# Basic profile fields, read from the first element matching each selector
+PROFILE_FIELDS = {
+    'name': "h1",
+    'headline': "div.text-body-medium",
+    'location': "span.text-body-small"
+}
+
+# Profile sections, found by their h2 heading, with the fields read from each list item
+PROFILE_SECTIONS = {
+    'education': {
+        'section': "section.artdeco-card",
+        'heading': "Education",
+        'items': "li.artdeco-list__item",
+        'fields': {
+            'school': "div.hoverable-link-text span[aria-hidden='true']",
+            'duration': "span.t-14.t-normal.t-black--light span[aria-hidden='true']"
+        }
+    },
+    'experiences': {
+        'section': "section",
+        'heading': "Experience",
+        'items': "li",
+        'fields': {
+            'title': "span[aria-hidden='true']",
+            'company': "span.t-14.t-normal",
+            'duration': "span.t-14.t-black--light",
+            'location': "span.t-14.t-black--light:nth-child(2)"
+        }
+    },
+    'skills': {
+        'section': "section",
+        'heading': "Skills",
+        'items': "li",
+        'fields': {
+            'skill': "span[aria-hidden='true']"
+        }
+    }
+}
+
+# Walks the profile DOM in the browser and returns every field in a single round-trip
+EXTRACT_PROFILE_JS = """
+({ fields, sections }) => {
+    const text = (root, selector) => {
+        const el = root.querySelector(selector);
+        return el ? el.innerText.trim() : "N/A";
+    };
+    const out = {};
+    for (const [key, selector] of Object.entries(fields)) {
+        out[key] = text(document, selector);
+    }
+    for (const [key, spec] of Object.entries(sections)) {
+        const heading = spec.heading.toLowerCase();
+        const section = [...document.querySelectorAll(spec.section)].find(s =>
+            [...s.querySelectorAll("h2")].some(h2 => h2.innerText.toLowerCase().includes(heading)));
+        const items = section ? [...section.querySelectorAll(spec.items)] : [];
+        out[key] = items.map(item => Object.fromEntries(
+            Object.entries(spec.fields).map(([field, selector]) => [field, text(item, selector)])));
+    }
+    return out;
+}
+"""
+
 def get_credentials_from_terminal() -> Dict[str, str]:
     """
     Prompts the user to input login credentials via the terminal.
@@ -29,28 +128,98 @@ def get_recent_csv(directory: str) -> str:
     Returns:
         str: Path to the most recent CSV file.
     """
-    files = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith('.csv')]
-    if not files:
+    with os.scandir(directory) as it:
+        entries = [entry for entry in it if entry.name.endswith('.csv')]
+    if not entries:
         raise FileNotFoundError("No CSV files found in the specified directory.")
-    return max(files, key=os.path.getctime)
+    return max(entries, key=lambda entry: entry.stat().st_ctime).path
 
-def get_names_from_csv(file_path: str) -> List[str]:
+def get_names_from_csv(file_path: str) -> List[Tuple[str, str]]:
     """
-    Reads names from a CSV file.
+    Reads names from a CSV file, pairing each with its casefolded form for matching.
 
     Args:
         file_path (str): Path to the CSV file.
 
     Returns:
-        List[str]: List of names from the CSV file.
+        List[Tuple[str, str]]: List of (name, casefolded name) pairs from the CSV file.
+    """
+    with open(file_path, newline='', encoding='utf-8-sig') as file:  # utf-8-sig drops the BOM Excel writes
+        reader = csv.DictReader(file)
+        if reader.fieldnames and 'names' in reader.fieldnames:
+            return [(row['names'], row['names'].casefold()) for row in reader]
+        else:
+            raise ValueError("CSV file must contain a 'names' column.")
+
+def could_match(name_lc: str, candidate_lc: str) -> bool:
+    """
+    Checks whether two names are close enough in length to reach MATCH_THRESHOLD with fuzz.ratio.
+
+    fuzz.ratio is 100 * (1 - indel_distance / (len(a) + len(b))) and the indel distance is at least
+    the length difference, so a larger difference rules the pair out without scoring it.
+
+    Args:
+        name_lc (str): Casefolded searched name.
+        candidate_lc (str): Casefolded candidate profile name.
+
+    Returns:
+        bool: False if the pair cannot reach the threshold.
+    """
+    max_length_delta = (100 - MATCH_THRESHOLD) / 100 * (len(name_lc) + len(candidate_lc))
+    return abs(len(name_lc) - len(candidate_lc)) <= max_length_delta
+
+def page_lost(page: Page, error: Exception) -> bool:
+    """
+    Checks whether an error means the page crashed or its page, context, or browser was closed.
+
+    Such errors must not be treated as "profile not found", since every later call on the page fails too.
+
+    Args:
+        page (Page): Playwright page the error came from.
+        error (Exception): The raised exception.
+
+    Returns:
+        bool: True if the page can no longer be used.
+    """
+    return page.is_closed() or (isinstance(error, Error) and any(marker in str(error) for marker in PAGE_LOST_MARKERS))
+
+async def _text(root: Union[Page, ElementHandle], selector: str, default: str = "N/A") -> str:
+    """
+    Reads the text of the first element matching a selector.
+
+    Looks up the element and reads its textContent in one round-trip; textContent, unlike
+    innerText, does not force a layout in the renderer.
+
+    Args:
+        root (Union[Page, ElementHandle]): Page or element to search within.
+        selector (str): CSS selector of the element.
+        default (str): Value returned when the element is missing or empty.
+
+    Returns:
+        str: Stripped text of the element, or `default`.
+    """
+    try:
+        text = await root.eval_on_selector(selector, "el => el.textContent")
+    except Error as e:
+        # A closed or crashed page must not look like a missing element
+        if any(marker in str(e) for marker in PAGE_LOST_MARKERS):
+            raise
+        return default
+    return text.strip() if text and text.strip() else default
+
+async def block_heavy_resources(route: Route) -> None:
+    """
+    Aborts requests for images, media, and fonts and lets every other request through.
+
+    Args:
+        route (Route): Playwright route for the intercepted request.
     """
-    data = pd.read_csv(file_path)
-    if 'names' in data.columns:
-        return data['names'].tolist()
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
     else:
-        raise ValueError("CSV file must contain a 'names' column.")
+        await route.continue_()
 
-def linkedin_login(page: Page, credentials: Dict[str, str]) -> None:
+async def linkedin_login(page: Page, credentials: Dict[str, str]) -> None:
     """
     Logs into LinkedIn using the provided credentials.
 
@@ -59,32 +228,31 @@ def linkedin_login(page: Page, credentials: Dict[str, str]) -> None:
         credentials (Dict[str, str]): Dictionary containing 'username' and 'password'.
     """
     print("Opening LinkedIn login page...")
-    page.goto("https://www.linkedin.com/login", timeout=60000)
+    await page.goto(LOGIN_URL, timeout=60000)
 
-    page.wait_for_selector("#username", timeout=60000)
+    await page.wait_for_selector(USERNAME_SEL, timeout=60000)
     print("LinkedIn login page loaded successfully.")
 
     print("Entering login credentials...")
-    page.fill("#username", credentials['username'])
-    page.fill("#password", credentials['password'])
+    await page.fill(USERNAME_SEL, credentials['username'])
+    await page.fill(PASSWORD_SEL, credentials['password'])
 
-    page.click("button[type='submit']")
+    await page.click(SUBMIT_SEL)
     print("Login submitted successfully.")
 
     # Check for verification prompt
     try:
-        verification_header = page.query_selector("h1.content__header")
-        if verification_header and "Let’s do a quick verification" in verification_header.inner_text():
+        if "Let’s do a quick verification" in await _text(page, VERIFICATION_HEADER_SEL, default=""):
             print("Verification required. Returning to input credentials.")
             return
     except Exception as e:
         print(f"Error checking for verification prompt: {e}")
 
     # Wait for LinkedIn homepage to load
-    page.wait_for_selector("input[placeholder='Search']", timeout=60000)
+    await page.wait_for_selector(SEARCH_INPUT_SEL, timeout=60000)
     print("LinkedIn homepage loaded successfully.")
 
-def extract_profile_data(page: Page) -> Dict[str, str]:
+async def extract_profile_data(page: Page) -> Dict[str, str]:
     """
     Extracts relevant data from a LinkedIn profile page, including experiences, education, and skills.
 
@@ -95,76 +263,16 @@ def extract_profile_data(page: Page) -> Dict[str, str]:
         Dict[str, str]: A dictionary containing extracted profile data.
     """
     print("Extracting profile data...")
-    profile_data = {}
-
-    # Extract basic profile information
-    try:
-        name_element = page.query_selector("h1")
-        profile_data['name'] = name_element.inner_text().strip() if name_element else "N/A"
-
-        headline_element = page.query_selector("div.text-body-medium")
-        profile_data['headline'] = headline_element.inner_text().strip() if headline_element else "N/A"
-
-        location_element = page.query_selector("span.text-body-small")
-        profile_data['location'] = location_element.inner_text().strip() if location_element else "N/A"
-    except Exception as e:
-        print(f"Error extracting basic profile information: {e}")
-
-    # Extract education
-    print("Extracting education...")
-    education_items = []
-    try:
-        education_section = page.query_selector("section.artdeco-card:has(h2:has-text('Education'))")
-        if education_section:
-            education_entries = education_section.query_selector_all("li.artdeco-list__item")
-            for entry in education_entries:
-                school_element = entry.query_selector("div.hoverable-link-text span[aria-hidden='true']")
-                duration_element = entry.query_selector("span.t-14.t-normal.t-black--light span[aria-hidden='true']")
-
-                education_items.append({
-                    "school": school_element.inner_text().strip() if school_element else "N/A",
-                    "duration": duration_element.inner_text().strip() if duration_element else "N/A"
-                })
-    except Exception as e:
-        print(f"Error extracting education: {e}")
-    profile_data['education'] = education_items
-
-    # Extract experiences
-    print("Extracting experiences...")
-    experiences = []
     try:
-        experience_section = page.query_selector("section:has(h2:has-text('Experience'))")
-        if experience_section:
-            experience_items = experience_section.query_selector_all("li")
-            for item in experience_items:
-                title_element = item.query_selector("span[aria-hidden='true']")
-                company_element = item.query_selector("span.t-14.t-normal")
-                duration_element = item.query_selector("span.t-14.t-black--light")
-                location_element = item.query_selector("span.t-14.t-black--light:nth-child(2)")
-
-                experiences.append({
-                    "title": title_element.inner_text().strip() if title_element else "N/A",
-                    "company": company_element.inner_text().strip() if company_element else "N/A",
-                    "duration": duration_element.inner_text().strip() if duration_element else "N/A",
-                    "location": location_element.inner_text().strip() if location_element else "N/A"
-                })
+        profile_data = await page.evaluate(EXTRACT_PROFILE_JS, {'fields': PROFILE_FIELDS, 'sections': PROFILE_SECTIONS})
     except Exception as e:
-        print(f"Error extracting experiences: {e}")
-    profile_data['experiences'] = experiences
+        if page_lost(page, e):
+            raise
+        print(f"Error extracting profile data: {e}")
+        profile_data = {key: "N/A" for key in PROFILE_FIELDS}
+        profile_data.update({key: [] for key in PROFILE_SECTIONS})
 
-    # Extract skills
-    print("Extracting skills...")
-    skills = []
-    try:
-        skills_section = page.query_selector("section:has(h2:has-text('Skills'))")
-        if skills_section:
-            skill_items = skills_section.query_selector_all("li")
-            for skill in skill_items:
-                skill_element = skill.query_selector("span[aria-hidden='true']")
-                skills.append(skill_element.inner_text().strip() if skill_element else "N/A")
-    except Exception as e:
-        print(f"Error extracting skills: {e}")
-    profile_data['skills'] = skills
+    profile_data['skills'] = [item['skill'] for item in profile_data['skills']]
 
     print("Profile data extracted successfully.")
     return profile_data
@@ -198,106 +306,147 @@ def save_profile_data_to_csv(profile_data: List[Dict[str, str]], output_director
             writer.writerows(profile_data)
         print(f"Extracted profiles saved to {alternative_file}")
 
-def save_data_incrementally(data_type: str, data: List[Dict[str, str]], file_path: str) -> None:
+def open_output_writers(output_directory: str, stack: ExitStack) -> Dict[str, csv.DictWriter]:
     """
-    Saves data incrementally to a CSV file.
+    Opens every output CSV file once for appending, with a large write buffer.
 
     Args:
-        data_type (str): Type of data being saved (e.g., 'profiles', 'experiences', 'skills', 'education').
-        data (List[Dict[str, str]]): List of dictionaries containing data to be saved.
-        file_path (str): Path to the CSV file where data will be saved.
-    """
-    if not data:
-        print(f"No {data_type} data to save.")
-        return
+        output_directory (str): Directory where the CSV files are saved.
+        stack (ExitStack): Exit stack that flushes and closes the files.
 
-    file_exists = os.path.isfile(file_path)
-
-    with open(file_path, mode='a', newline='', encoding='utf-8') as file:
-        fieldnames = data[0].keys()
+    Returns:
+        Dict[str, csv.DictWriter]: Writers keyed by data type ('profiles', 'education', 'experiences', 'skills').
+    """
+    writers = {}
+    for data_type, (file_name, fieldnames) in OUTPUT_FILES.items():
+        file_path = os.path.join(output_directory, file_name)
+        file = stack.enter_context(open(file_path, mode='a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE))
         writer = csv.DictWriter(file, fieldnames=fieldnames)
 
-        if not file_exists:
+        if file.tell() == 0:
             writer.writeheader()
 
-        writer.writerows(data)
-
-    print(f"{data_type.capitalize()} data saved incrementally to {file_path}.")
+        writers[data_type] = writer
+    return writers
 
-def search_and_handle_profiles(page: Page, names: List[str], output_directory: str) -> None:
+async def search_and_handle_profiles(browser: Browser, storage_state: str, names: List[Tuple[str, str]], output_directory: str, max_parallel: int = MAX_PARALLEL) -> List[Tuple[str, str]]:
     """
-    Searches for names on LinkedIn, extracts profile data, and saves data incrementally.
+    Searches for names on LinkedIn in parallel, extracts profile data, and saves data incrementally.
+
+    Up to `max_parallel` workers each open one browser context from the authenticated storage state
+    and keep pulling names from a shared queue until it is empty, opening each name's people search
+    results directly by URL. Duplicate scoring and CSV writes run on a small thread pool so they
+    overlap the next page load.
 
     Args:
-        page (Page): Playwright page object.
-        names (List[str]): List of names to search for.
+        browser (Browser): Playwright browser used to create the worker contexts.
+        storage_state (str): Path to the storage state file of the logged-in session.
+        names (List[Tuple[str, str]]): List of (name, casefolded name) pairs to search for.
         output_directory (str): Directory where extracted data will be saved.
+        max_parallel (int): Maximum number of names processed concurrently.
+
+    Returns:
+        List[Tuple[str, str]]: Names that failed and should be retried.
     """
-    extracted_profiles = []  # Define extracted_profiles to track processed profiles
-    extracted_education = []  # Define extracted_education to store education data
-    extracted_experiences = []  # Define extracted_experiences to store experiences data
-    extracted_skills = []  # Define extracted_skills to store skills data
+    existing_names_lc = []  # Casefolded names of every profile written so far, for duplicate checks
+    failed_names = []  # Define failed_names to collect names to retry
+    write_lock = threading.Lock()  # Guards existing_names_lc and the CSV writers across post-processing threads
+    postprocessing = []  # Define postprocessing to track (entry, future) pairs still running in the executor
+
+    pending = asyncio.Queue()
+    for entry in names:
+        pending.put_nowait(entry)
+
+    def postprocess(matched_names_lc: List[str], name_profiles: List[Dict[str, str]], extracted_education: List[Dict[str, str]], extracted_experiences: List[Dict[str, str]], extracted_skills: List[Dict[str, str]]) -> None:
+        with write_lock:
+            # Count duplicates across all previously extracted profiles
+            # default_process turns punctuation into spaces and token_sort_ratio ignores word order,
+            # so "Jay-ar Santos" matches "Jay Ar Santos", while "Maria" does not match "Maria Santos"
+            # A scoring failure only loses the count, never the rows below
+            try:
+                if matched_names_lc and existing_names_lc:
+                    duplicate_count = sum(
+                        len(process.extract(matched_lc, existing_names_lc, scorer=fuzz.token_sort_ratio, processor=default_process, score_cutoff=MATCH_THRESHOLD, limit=None))
+                        for matched_lc in matched_names_lc
+                    )
+                    for profile in name_profiles:
+                        profile['duplicate_count'] = duplicate_count
+            except Exception as e:
+                print(f"Error counting duplicates: {e}")
+
+            existing_names_lc.extend(profile['name'].casefold() for profile in name_profiles)
+
+            # Append extracted data to the separate CSV files
+            writers['profiles'].writerows(name_profiles)
+            writers['education'].writerows(extracted_education)
+            writers['experiences'].writerows(extracted_experiences)
+            writers['skills'].writerows(extracted_skills)
+
+    async def handle(page: Page, entry: Tuple[str, str]) -> None:
+        name, name_lc = entry
+        extracted_education = []  # Define extracted_education to store education data
+        extracted_experiences = []  # Define extracted_experiences to store experiences data
+        extracted_skills = []  # Define extracted_skills to store skills data
+        name_profiles = []  # Define name_profiles to store the profile rows found for this name
 
-    for name in names:
         print(f"Searching for {name}...")
         attempt = 0
         matched_profiles = []
 
         while attempt < 2:
+            # Element handles from an earlier attempt belong to a page that has since been replaced
+            matched_profiles = []
             try:
-                # Perform search
-                page.fill("input[placeholder='Search']", name)
-                page.press("input[placeholder='Search']", "Enter")
-                page.wait_for_timeout(5000)  # Wait for search results to load
+                # Open the people search results directly instead of typing into the search box
+                await page.goto(PEOPLE_SEARCH_URL.format(quote_plus(name)), wait_until='domcontentloaded', timeout=30000)
+                # Wait for either search results or the empty-results page to render
+                await page.wait_for_selector(SEARCH_SETTLED_SEL, timeout=15000)
 
-                profile_containers = page.query_selector_all("div[data-chameleon-result-urn]")
+                profile_containers = await page.query_selector_all(SEARCH_RESULT_SEL)
                 if not profile_containers:
                     print(f"No profiles found for {name}. Skipping...")
                     break
 
                 for container in profile_containers:
-                    profile_name_element = container.query_selector("a span[aria-hidden='true']")
-                    if profile_name_element:
-                        profile_name = profile_name_element.inner_text().strip()
+                    profile_name = await _text(container, RESULT_NAME_SEL, default="")
+                    if profile_name:
                         print(f"Extracted profile name: {profile_name}")
-
-                        match_score = fuzz.ratio(name.lower(), profile_name.lower())
-                        print(f"Match score: {match_score}")
-
-                        if match_score >= 90:
+                        profile_name_lc = profile_name.casefold()
+                        # Skip names whose length alone rules out a match
+                        if not could_match(name_lc, profile_name_lc):
+                            continue
+
+                        # Same score as fuzz.ratio / 100, without the scorer wrapper; 0 when below the cutoff
+                        match_score = Indel.normalized_similarity(name_lc, profile_name_lc, score_cutoff=MATCH_THRESHOLD / 100)
+                        if match_score:
+                            print(f"Match score for {profile_name}: {match_score * 100:.1f}")
                             matched_profiles.append({
                                 "container": container,
-                                "name": profile_name
+                                "name": profile_name,
+                                "name_lc": profile_name_lc
                             })
 
                 if matched_profiles:
-                    print(f"Found {len(matched_profiles)} matching profiles for {name}. Checking for duplicates...")
-                    
-                    # Count duplicates across all previously extracted profiles
-                    duplicate_count = sum(
-                        fuzz.ratio(existing_profile['name'].lower(), matched['name'].lower()) >= 90
-                        for existing_profile in extracted_profiles
-                        for matched in matched_profiles
-                    )
+                    print(f"Found {len(matched_profiles)} matching profiles for {name}.")
 
                     # Proceed with the first matched profile
                     first_match = matched_profiles[0]["container"]
-                    profile_link = first_match.query_selector("a[href]")
+                    profile_link = await first_match.query_selector(RESULT_LINK_SEL)
                     if profile_link:
-                        profile_link.click()
-                        page.wait_for_timeout(5000)  # Wait for profile page to load
+                        await profile_link.click()
+                        # Wait for the profile page to load
+                        await page.wait_for_url(PROFILE_URL_PATTERN, wait_until='domcontentloaded', timeout=15000)
+                        await page.wait_for_selector(PROFILE_HEADING_SEL, timeout=15000)
 
-                        profile_data = extract_profile_data(page)
+                        profile_data = await extract_profile_data(page)
                         print(f"Extracted profile data: {profile_data}")
 
-                        # Log duplicate count
-                        profile_data['duplicate_count'] = duplicate_count
-
-                        extracted_profiles.append({
+                        # The duplicate count is filled in by postprocess
+                        name_profiles.append({
                             'name': profile_data['name'],
                             'headline': profile_data['headline'],
                             'location': profile_data['location'],
-                            'duplicate_count': profile_data['duplicate_count']
+                            'duplicate_count': 0
                         })
 
                         # Add education, experiences, and skills to their respective lists
@@ -309,69 +458,176 @@ def search_and_handle_profiles(page: Page, names: List[str], output_directory: s
                             extracted_skills.append({'name': profile_data['name'], 'skill': skill})
 
                         break  # Proceed with the first matched profile
+                    else:
+                        print(f"No profile link found for {name}. Retrying...")
+                        attempt += 1
                 else:
                     print(f"No matching profiles found for {name}. Retrying...")
                     attempt += 1
             except Exception as e:
+                # A lost page fails every attempt; let the worker retry the name on a fresh page instead
+                if page_lost(page, e):
+                    raise
                 print(f"Error processing profile {name}: {e}")
                 attempt += 1
 
         if attempt == 2 and not matched_profiles:
             print(f"No matching profiles found for {name} after 2 attempts. Adding notice to CSV...")
-            extracted_profiles.append({
+            name_profiles.append({
                 'name': name,
                 'headline': "N/A",
                 'location': "N/A",
                 'duplicate_count': 0
             })
+        elif matched_profiles and not name_profiles:
+            # A match was found but its profile could not be opened; hand the name back for a retry
+            raise RuntimeError(f"Matched a profile for {name} but could not open it after {attempt} attempts")
+
+        # Score duplicates and write rows in the background while this worker moves on to the next name
+        postprocessing.append((entry, asyncio.get_running_loop().run_in_executor(
+            executor,
+            postprocess,
+            [matched['name_lc'] for matched in matched_profiles],
+            name_profiles,
+            extracted_education,
+            extracted_experiences,
+            extracted_skills
+        )))
+
+    async def new_worker_page() -> Page:
+        context = await browser.new_context(storage_state=storage_state)
+        await context.route("**/*", block_heavy_resources)
+        return await context.new_page()
+
+    async def close_worker_page(page: Page) -> None:
+        try:
+            await page.context.close()
+        except Error as e:
+            print(f"Error closing worker context: {e}")
 
-    # Save extracted data to separate CSV files
-    save_data_incrementally('profiles', extracted_profiles, os.path.join(output_directory, 'ExtractedProfiles.csv'))
-    save_data_incrementally('education', extracted_education, os.path.join(output_directory, 'Education.csv'))
-    save_data_incrementally('experiences', extracted_experiences, os.path.join(output_directory, 'Experiences.csv'))
-    save_data_incrementally('skills', extracted_skills, os.path.join(output_directory, 'Skills.csv'))
+    async def worker() -> None:
+        page = await new_worker_page()
+        try:
+            while True:
+                # Other workers may empty the queue while this one awaits, so take the entry before anything else
+                try:
+                    entry = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
 
-def open_linkedin_login_and_search(credentials: Dict[str, str], names: List[str], output_directory: str) -> None:
+                try:
+                    # Replace a page that crashed or was closed so one failure does not fail the rest of the queue
+                    if page.is_closed():
+                        print("Worker page was closed. Opening a new browser context...")
+                        await close_worker_page(page)
+                        page = await new_worker_page()
+
+                    await handle(page, entry)
+                except Exception as e:
+                    print(f"Error processing profile {entry[0]}: {e}")
+                    failed_names.append(entry)
+                    if page_lost(page, e):
+                        await close_worker_page(page)
+                        page = await new_worker_page()
+        finally:
+            await close_worker_page(page)
+
+    with ExitStack() as stack:
+        writers = open_output_writers(output_directory, stack)
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=POSTPROCESS_WORKERS))
+        results = await asyncio.gather(*(worker() for _ in range(min(max_parallel, len(names)))), return_exceptions=True)
+        postprocess_results = await asyncio.gather(*(future for _, future in postprocessing), return_exceptions=True)
+    print(f"Extracted data saved to {output_directory}.")
+
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Worker stopped: {result!r}")
+    # Names whose rows could not be written are retried like any other failed name
+    for (entry, _), result in zip(postprocessing, postprocess_results):
+        if isinstance(result, Exception):
+            print(f"Error saving profile data for {entry[0]}: {result}")
+            failed_names.append(entry)
+
+    # Names left in the queue were never picked up because their workers failed to start
+    while not pending.empty():
+        failed_names.append(pending.get_nowait())
+    return failed_names
+
+async def open_linkedin_login_and_search_async(credentials: Dict[str, str], names: List[Tuple[str, str]], output_directory: str, max_parallel: int = MAX_PARALLEL) -> None:
     """
-    Logs into LinkedIn, searches for names, and handles profiles.
+    Logs into LinkedIn (or reuses a saved session), then searches for names in parallel and handles profiles.
 
     Args:
         credentials (Dict[str, str]): Dictionary containing 'username' and 'password'.
-        names (List[str]): List of names to search for.
+        names (List[Tuple[str, str]]): List of (name, casefolded name) pairs to search for.
         output_directory (str): Directory where extracted data will be saved.
+        max_parallel (int): Maximum number of names processed concurrently.
     """
-    last_processed_index = 0
+    if not os.path.exists(output_directory):
+        os.makedirs(output_directory)
+
+    state_path = os.path.join(output_directory, '.linkedin_state.json')  # Session saved by a previous run, if any
+    pending_names = list(names)
     max_retries = 3
     retry_count = 0
 
-    while retry_count < max_retries:
+    # One browser is kept for every attempt; a retry only recreates the contexts
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=False)
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                context = browser.new_context()
-                page = context.new_page()
-
-                linkedin_login(page, credentials)
+            while retry_count < max_retries:
+                try:
+                    if not browser.is_connected():
+                        print("Browser disconnected. Relaunching...")
+                        browser = await p.chromium.launch(headless=False)
 
-                # Resume from the last processed name
-                for index in range(last_processed_index, len(names)):
-                    name = names[index]
-                    print(f"Processing profile: {name} (Index: {index})")
+                    context = await browser.new_context(storage_state=state_path if os.path.exists(state_path) else None)
                     try:
-                        search_and_handle_profiles(page, [name], output_directory)
-                        last_processed_index = index + 1  # Update the last processed index
-                    except Exception as profile_error:
-                        print(f"Error processing profile {name}: {profile_error}")
-                        raise profile_error
-
-                browser.close()
-                print("Browser closed successfully.")
-                return
-        except Exception as e:
-            retry_count += 1
-            print(f"An error occurred: {e}. Retrying... ({retry_count}/{max_retries})")
-
-    print("Max retries exceeded. Ending process.")
+                        await context.route("**/*", block_heavy_resources)
+                        page = await context.new_page()
+
+                        # Reuse the saved session and only log in if LinkedIn does not recognize it.
+                        # A logged-out session is redirected away from the feed (login page, authwall, or guest
+                        # homepage); on the feed, wait until the search box or a login form has rendered before deciding.
+                        await page.goto(FEED_URL, timeout=60000)
+                        if "/feed" in page.url:
+                            await page.wait_for_selector(f"{SEARCH_INPUT_SEL}, {USERNAME_SEL}", timeout=60000)
+                        if "/feed" in page.url and await page.query_selector(SEARCH_INPUT_SEL):
+                            print("Reusing saved LinkedIn session.")
+                        else:
+                            await linkedin_login(page, credentials)
+
+                        # Persist the authenticated session for worker contexts and future runs
+                        await context.storage_state(path=state_path)
+                    finally:
+                        await context.close()
+
+                    # Resume with the names that have not been processed yet
+                    print(f"Processing {len(pending_names)} profiles with up to {max_parallel} in parallel...")
+                    pending_names = await search_and_handle_profiles(browser, state_path, pending_names, output_directory, max_parallel)
+
+                    if not pending_names:
+                        return
+                    raise RuntimeError(f"{len(pending_names)} profiles could not be processed")
+                except Exception as e:
+                    retry_count += 1
+                    print(f"An error occurred: {e}. Retrying... ({retry_count}/{max_retries})")
+
+            print("Max retries exceeded. Ending process.")
+        finally:
+            await browser.close()
+            print("Browser closed successfully.")
+
+def open_linkedin_login_and_search(credentials: Dict[str, str], names: List[Tuple[str, str]], output_directory: str) -> None:
+    """
+    Logs into LinkedIn, searches for names, and handles profiles.
+
+    Args:
+        credentials (Dict[str, str]): Dictionary containing 'username' and 'password'.
+        names (List[Tuple[str, str]]): List of (name, casefolded name) pairs to search for.
+        output_directory (str): Directory where extracted data will be saved.
+    """
+    asyncio.run(open_linkedin_login_and_search_async(credentials, names, output_directory))
 
 if __name__ == "__main__":
     print("Script started.")